@@ -3,29 +3,41 @@ functions creating them."""
 
 from __future__ import annotations
 
+from functools import lru_cache
 import sys
 from typing import Any
 from typing import Callable
 from typing import cast
+from typing import Final
 from typing import NoReturn
 from typing import Protocol
 from typing import Type
+from typing import TYPE_CHECKING
 from typing import TypeVar
+import warnings
 
 from .warning_types import PytestDeprecationWarning
 
 
+if TYPE_CHECKING:
+    from packaging.version import Version
+
+
+_MSG_TYPE_ERROR: Final = (
+    "{} expected string as 'msg' parameter, got '{}' instead.\n"
+    "Perhaps you meant to use a mark?"
+)
+
+
 class OutcomeException(BaseException):
     """OutcomeException and its subclass instances indicate and contain info
     about test and collection outcomes."""
 
     def __init__(self, msg: str | None = None, pytrace: bool = True) -> None:
-        if msg is not None and not isinstance(msg, str):
-            error_msg = (  # type: ignore[unreachable]
-                "{} expected string as 'msg' parameter, got '{}' instead.\n"
-                "Perhaps you meant to use a mark?"
+        if msg is not None and type(msg) is not str and not isinstance(msg, str):
+            raise TypeError(
+                _MSG_TYPE_ERROR.format(type(self).__name__, type(msg).__name__)
             )
-            raise TypeError(error_msg.format(type(self).__name__, type(msg).__name__))
         super().__init__(msg)
         self.msg = msg
         self.pytrace = pytrace
@@ -38,6 +50,10 @@ class OutcomeException(BaseException):
     __str__ = __repr__
 
 
+# Exceptions which can be the outcome of running a test or collecting a node.
+# OutcomeException derives from BaseException and not Exception, so both are
+# needed; code interested only in pytest's own outcomes should catch
+# OutcomeException directly.
 TEST_OUTCOME = (OutcomeException, Exception)
 
 
@@ -206,6 +222,14 @@ def xfail(reason: str = "") -> NoReturn:
     raise XFailed(reason)
 
 
+@lru_cache(maxsize=256)
+def _parse_version(version: str) -> Version:
+    # Imported lazily to improve start-up time.
+    from packaging.version import Version
+
+    return Version(version)
+
+
 def importorskip(
     modname: str,
     minversion: str | None = None,
@@ -251,66 +275,73 @@ def importorskip(
 
         The ``exc_type`` parameter.
     """
-    import warnings
-
     __tracebackhide__ = True
-    compile(modname, "", "eval")  # to catch syntaxerrors
-
-    # Until pytest 9.1, we will warn the user if we catch ImportError (instead of ModuleNotFoundError),
-    # as this might be hiding an installation/environment problem, which is not usually what is intended
-    # when using importorskip() (#11523).
-    # In 9.1, to keep the function signature compatible, we just change the code below to:
-    # 1. Use `exc_type = ModuleNotFoundError` if `exc_type` is not given.
-    # 2. Remove `warn_on_import` and the warning handling.
-    if exc_type is None:
-        exc_type = ImportError
-        warn_on_import_error = True
-    else:
-        warn_on_import_error = False
-
-    skipped: Skipped | None = None
-    warning: Warning | None = None
-
-    with warnings.catch_warnings():
-        # Make sure to ignore ImportWarnings that might happen because
-        # of existing directories with the same name we're trying to
-        # import but without a __init__.py file.
-        warnings.simplefilter("ignore")
-
-        try:
-            __import__(modname)
-        except exc_type as exc:
-            # Do not raise or issue warnings inside the catch_warnings() block.
+
+    # Modules which are already imported are returned straight from
+    # sys.modules, bypassing the import machinery. Failed imports are not
+    # remembered, as the module might become importable later on.
+    mod = sys.modules.get(modname)
+    if mod is None:
+        compile(modname, "", "eval")  # to catch syntaxerrors
+
+        # Until pytest 9.1, we will warn the user if we catch ImportError (instead of ModuleNotFoundError),
+        # as this might be hiding an installation/environment problem, which is not usually what is intended
+        # when using importorskip() (#11523).
+        # In 9.1, to keep the function signature compatible, we just change the code below to:
+        # 1. Use `exc_type = ModuleNotFoundError` if `exc_type` is not given.
+        # 2. Remove `warn_on_import` and the warning handling.
+        if exc_type is None:
+            exc_type = ImportError
+            warn_on_import_error = True
+        else:
+            warn_on_import_error = False
+
+        skipped: Skipped | None = None
+        warning: Warning | None = None
+
+        with warnings.catch_warnings():
+            # Make sure to ignore ImportWarnings that might happen because
+            # of existing directories with the same name we're trying to
+            # import but without a __init__.py file.
+            warnings.simplefilter("ignore")
+
+            try:
+                __import__(modname)
+            except exc_type as exc:
+                # Do not raise or issue warnings inside the catch_warnings() block.
+                if reason is None:
+                    reason = f"could not import {modname!r}: {exc}"
+                skipped = Skipped(reason, allow_module_level=True)
+
+                if warn_on_import_error and not isinstance(exc, ModuleNotFoundError):
+                    lines = [
+                        "",
+                        f"Module '{modname}' was found, but when imported by pytest it raised:",
+                        f"    {exc!r}",
+                        "In pytest 9.1 this warning will become an error by default.",
+                        "You can fix the underlying problem, or alternatively overwrite this behavior and silence this "
+                        "warning by passing exc_type=ImportError explicitly.",
+                        "See https://docs.pytest.org/en/stable/deprecations.html#pytest-importorskip-default-behavior-regarding-importerror",
+                    ]
+                    warning = PytestDeprecationWarning("\n".join(lines))
+
+        if warning:
+            warnings.warn(warning, stacklevel=2)
+        if skipped:
+            raise skipped
+
+        mod = sys.modules.get(modname)
+        if mod is None:
+            # The module replaced its sys.modules entry with None while being imported.
             if reason is None:
-                reason = f"could not import {modname!r}: {exc}"
-            skipped = Skipped(reason, allow_module_level=True)
-
-            if warn_on_import_error and not isinstance(exc, ModuleNotFoundError):
-                lines = [
-                    "",
-                    f"Module '{modname}' was found, but when imported by pytest it raised:",
-                    f"    {exc!r}",
-                    "In pytest 9.1 this warning will become an error by default.",
-                    "You can fix the underlying problem, or alternatively overwrite this behavior and silence this "
-                    "warning by passing exc_type=ImportError explicitly.",
-                    "See https://docs.pytest.org/en/stable/deprecations.html#pytest-importorskip-default-behavior-regarding-importerror",
-                ]
-                warning = PytestDeprecationWarning("\n".join(lines))
-
-    if warning:
-        warnings.warn(warning, stacklevel=2)
-    if skipped:
-        raise skipped
-
-    mod = sys.modules[modname]
+                reason = f"could not import {modname!r}: sys.modules entry is None after import"
+            raise Skipped(reason, allow_module_level=True)
+
     if minversion is None:
         return mod
     verattr = getattr(mod, "__version__", None)
     if minversion is not None:
-        # Imported lazily to improve start-up time.
-        from packaging.version import Version
-
-        if verattr is None or Version(verattr) < Version(minversion):
+        if verattr is None or _parse_version(verattr) < _parse_version(minversion):
             raise Skipped(
                 f"module {modname!r} has __version__ {verattr!r}, required is: {minversion!r}",
                 allow_module_level=True,
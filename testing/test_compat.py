@@ -180,8 +180,8 @@ def test_safe_getattr() -> None:
     helper = ErrorsHelper()
     assert safe_getattr(helper, "raise_exception", "default") == "default"
     assert safe_getattr(helper, "raise_fail_outcome", "default") == "default"
-    with pytest.raises(BaseException):  # noqa: B017
-        assert safe_getattr(helper, "raise_baseexception", "default")
+    with pytest.raises(BaseException, match="base exception should be raised"):
+        safe_getattr(helper, "raise_baseexception", "default")
 
 
 def test_safe_isclass() -> None:
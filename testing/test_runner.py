@@ -1,10 +1,12 @@
 # mypy: allow-untyped-defs
 from __future__ import annotations
 
+import copy
 from functools import partial
 import inspect
 import os
 from pathlib import Path
+import pickle
 import sys
 import types
 import warnings
@@ -878,6 +880,36 @@ def test_importorskip_dev_module(monkeypatch) -> None:
         assert False, f"spurious skip: {ExceptionInfo.from_current()}"
 
 
+def test_importorskip_failure_not_cached(monkeypatch) -> None:
+    """A failed import is retried on the next call (the module might have
+    become importable in the meantime)."""
+    with pytest.raises(pytest.skip.Exception):
+        pytest.importorskip("hello_importorskip_later")
+    mod = types.ModuleType("hello_importorskip_later")
+    monkeypatch.setitem(sys.modules, "hello_importorskip_later", mod)
+    assert pytest.importorskip("hello_importorskip_later") is mod
+
+
+def test_importorskip_module_entry_replaced_with_none(
+    pytester: Pytester, monkeypatch: MonkeyPatch
+) -> None:
+    """Skip if the imported module replaces its sys.modules entry with None."""
+    monkeypatch.delitem(sys.modules, "vanishing_module", raising=False)
+    pytester.syspathinsert()
+    pytester.makepyfile(
+        vanishing_module="""
+        import sys
+        sys.modules[__name__] = None
+        """
+    )
+    with pytest.raises(pytest.skip.Exception, match=r"sys\.modules entry is None"):
+        pytest.importorskip("vanishing_module")
+    # The entry is now None; remove it so the module is imported again.
+    monkeypatch.delitem(sys.modules, "vanishing_module")
+    with pytest.raises(pytest.skip.Exception, match=r"^custom reason$"):
+        pytest.importorskip("vanishing_module", reason="custom reason")
+
+
 def test_importorskip_module_level(pytester: Pytester) -> None:
     """`importorskip` must be able to skip entire modules when used at module level."""
     pytester.makepyfile(
@@ -1198,6 +1230,79 @@ def test_outcome_exception_bad_msg() -> None:
         OutcomeException(func)  # type: ignore
     assert str(excinfo.value) == expected
 
+    # Subclasses report their own name.
+    with pytest.raises(TypeError) as excinfo:
+        outcomes.Skipped(func)  # type: ignore
+    assert str(excinfo.value) == expected.replace("OutcomeException", "Skipped")
+
+    skipped = outcomes.Skipped("m", pytrace=False)
+    assert skipped.msg == "m"
+    assert skipped.args == ("m",)
+    assert skipped.pytrace is False
+    assert skipped.allow_module_level is False
+    assert skipped._use_item_location is False
+
+
+def test_skipped_init_follows_mro() -> None:
+    """Skipped.__init__ cooperates with other bases' __init__."""
+
+    class Mixin(BaseException):
+        def __init__(self, *args: object) -> None:
+            super().__init__(*args)
+            self.mixed = True
+
+    class C(outcomes.Skipped, Mixin):
+        pass
+
+    exc = C("x")
+    assert exc.mixed is True
+    assert exc.msg == "x"
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        outcomes.Skipped(
+            "r", pytrace=False, allow_module_level=True, _use_item_location=True
+        ),
+        outcomes.Failed("x", pytrace=False),
+        outcomes.XFailed("x"),
+        outcomes.Exit("bye", returncode=3),
+    ],
+    ids=["Skipped", "Failed", "XFailed", "Exit"],
+)
+def test_outcome_exception_copy(exc: BaseException) -> None:
+    """Attributes stored in __slots__ survive copying."""
+    copied = copy.copy(exc)
+    assert type(copied) is type(exc)
+    assert copied.args == exc.args
+    for name in ("msg", "pytrace", "allow_module_level", "_use_item_location"):
+        assert getattr(copied, name, None) == getattr(exc, name, None)
+    assert getattr(copied, "returncode", None) == getattr(exc, "returncode", None)
+
+
+def test_exit_pickle() -> None:
+    exc = pickle.loads(pickle.dumps(outcomes.Exit("bye", returncode=3)))
+    assert exc.msg == "bye"
+    assert exc.returncode == 3
+
+
+@pytest.mark.parametrize(
+    "bases",
+    [
+        (outcomes.Exit, SystemExit),
+        (outcomes.Exit, OSError),
+        (outcomes.Skipped, ImportError),
+        (outcomes.Skipped, outcomes.Exit),
+        (outcomes.Failed, outcomes.Exit),
+    ],
+)
+def test_outcome_exception_multiple_inheritance(bases: tuple[type, ...]) -> None:
+    """Outcome exceptions can be combined with exceptions having their own
+    instance layout (plugins subclass them like this)."""
+    cls = type("Combined", bases, {})
+    assert isinstance(cls("x"), bases)
+
 
 def test_pytest_version_env_var(pytester: Pytester, monkeypatch: MonkeyPatch) -> None:
     monkeypatch.setenv("PYTEST_VERSION", "old version")